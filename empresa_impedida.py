@@ -12,10 +12,13 @@ from common.input_param import InputParamDef
 from common.get_input_params import GetInputParams
 from common.logging import log
 from common import util
-from graph import GraphAnalysis
+from graph import GraphAnalysis, DEFAULT_MAX_PATHS, DEFAULT_MAX_PREFIXES
 
 INPUT_CSV_EDGES = 'csv_edges'
 OUTPUT_TXT_IMPEDIMENTOS = 'txt_impedimentos'
+INPUT_ALL_PATHS = 'all_paths'
+INPUT_MAX_PATHS = 'max_paths'
+INPUT_MAX_PREFIXES = 'max_prefixes'
 
 INPUT_PARAMS_DEF = {                                              
     INPUT_CSV_EDGES: InputParamDef(INPUT_CSV_EDGES,
@@ -26,15 +29,43 @@ INPUT_PARAMS_DEF = {
     OUTPUT_TXT_IMPEDIMENTOS: InputParamDef(OUTPUT_TXT_IMPEDIMENTOS,
                                            '[OUTPUT] Arquivo TXT dos caminhos do grafo que denotam impedimentos',
                                            r'C:\output\impedimentos.txt',
-                                           None)
+                                           None),
+    
+    INPUT_ALL_PATHS: InputParamDef(INPUT_ALL_PATHS,
+                                   '[INPUT] Pesquisa todos os caminhos de impedimento (e nao apenas o caminho minimo)',
+                                   'True',
+                                   'False'),
+    
+    INPUT_MAX_PATHS: InputParamDef(INPUT_MAX_PATHS,
+                                   '[INPUT] Quantidade maxima de caminhos por licitacao/contrato (utilizado com all_paths)',
+                                   '100',
+                                   str(DEFAULT_MAX_PATHS)),
+    
+    INPUT_MAX_PREFIXES: InputParamDef(INPUT_MAX_PREFIXES,
+                                      '[INPUT] Quantidade maxima de arestas examinadas na expansao dos prefixos de caminho por licitacao/contrato (utilizado com all_paths)',
+                                      '10000',
+                                      str(DEFAULT_MAX_PREFIXES))
 }
 
+def get_positive_int(input_params: dict, param: str) -> int:
+    try:
+        val = int(input_params[param])
+    except ValueError:
+        val = 0
+        
+    if (val < 1):
+        raise ValueError(f"Parametro {param} deve ser um numero inteiro maior ou igual a 1 " \
+                         f"(valor informado: {input_params[param]})")
+    return val
+
 def main(): 
     try:
         get_input_params = GetInputParams(f"{__spec__.name}",
                                           INPUT_PARAMS_DEF,
                                           sys.argv)
         input_params = get_input_params.get()
+        max_paths = get_positive_int(input_params, INPUT_MAX_PATHS)
+        max_prefixes = get_positive_int(input_params, INPUT_MAX_PREFIXES)
     except Exception as e:
         print(e)
         sys.exit(1)
@@ -42,7 +73,10 @@ def main():
     start = util.now_time()
     
     graph_analysis = GraphAnalysis(csv_edges = input_params[INPUT_CSV_EDGES],
-                                   output_paths_txt = input_params[OUTPUT_TXT_IMPEDIMENTOS])
+                                   output_paths_txt = input_params[OUTPUT_TXT_IMPEDIMENTOS],
+                                   all_paths = util.str_to_bool(input_params[INPUT_ALL_PATHS]),
+                                   max_paths = max_paths,
+                                   max_prefixes = max_prefixes)
     
     graph_analysis.search_paths()
     
@@ -18,23 +18,33 @@ from common.logging import log
 from common import util
 from classes.counter import Counter
 
+# Limites default da pesquisa de todos os caminhos (por licitacao/contrato)
+DEFAULT_MAX_PATHS = 1000
+DEFAULT_MAX_PREFIXES = 100000
+
 # Funcao utilizada no inicializador do Pool de processos
 def init_globals(graph: ig.Graph,
                  total_licit_contrato: int,
                  iter_counter: Counter,
                  path_counter: Counter,
-                 txt_output_paths: str):
+                 txt_output_paths: str,
+                 max_paths: int = None,
+                 max_prefixes: int = None):
     global pool_graph
     global pool_total_licit_contrato
     global pool_iter_counter
     global pool_path_counter
     global pool_txt_output_paths
+    global pool_max_paths
+    global pool_max_prefixes
     
     pool_graph = graph
     pool_total_licit_contrato = total_licit_contrato
     pool_iter_counter = iter_counter
     pool_path_counter = path_counter
     pool_txt_output_paths = txt_output_paths
+    pool_max_paths = max_paths
+    pool_max_prefixes = max_prefixes
 
 def is_vertex_licit_contrato(vs: ig.Vertex) -> bool:
     return vs[util.V_PROP_TIPO] in [util.V_CONTRATO, util.V_LICITACAO]
@@ -93,6 +103,27 @@ def is_path_contratacao_impedida(shortest_paths: list, i: int, j: int) -> bool:
         else:
             return False
     
+# Sequencias de tipos dos caminhos que denotam impedimentos 
+# ([C] representa tanto Contrato quanto Licitacao)
+TIPOS_CAMINHO_IMPEDIDO = [(util.V_CONTRATO, util.V_FORNECEDOR, util.V_SANCAO),
+                          (util.V_CONTRATO, util.V_FORNECEDOR, util.V_EMPREGADO),
+                          (util.V_CONTRATO, util.V_FORNECEDOR, util.V_SOCIO, util.V_EMPREGADO),
+                          (util.V_CONTRATO, util.V_FORNECEDOR, util.V_SOCIO, util.V_FORNECEDOR, util.V_SANCAO)]
+
+def tipo_caminho(vs: ig.Vertex) -> str:
+    return util.V_CONTRATO if is_vertex_licit_contrato(vs) else vs[util.V_PROP_TIPO]
+
+# Verifica se a sequencia de tipos e' um dos tipos de caminho de impedimento
+def is_vpath_tipo_impedido(vpath_tipo: list) -> bool:
+    return tuple(vpath_tipo) in TIPOS_CAMINHO_IMPEDIDO
+
+# Verifica se a sequencia de tipos ainda pode ser estendida ate' um dos 
+# tipos de caminho de impedimento (poda da enumeracao de todos os caminhos)
+def is_vpath_tipo_expansivel(vpath_tipo: list) -> bool:
+    n = len(vpath_tipo)
+    return any((len(tipos) > n) and (tipos[:n] == tuple(vpath_tipo))
+               for tipos in TIPOS_CAMINHO_IMPEDIDO)
+    
 def epath_log_msg(epath: list) -> str:
     epath_labels = []
     for i in epath:
@@ -121,17 +152,117 @@ def verify_path(i: int):
                 f" {path_counter}. {epath_imped}")
             log(epath_log_msg(epath_imped), log_file = pool_txt_output_paths)
 
+# Motivos de truncamento da enumeracao de todos os caminhos
+LIMITE_CAMINHOS = 'caminhos'
+LIMITE_PREFIXOS = 'prefixos'
+
+# Enumera todos os caminhos de impedimento a partir do vertice "v[i]", em uma
+# unica busca em profundidade. Os prefixos comuns sao expandidos uma unica vez
+# e os caminhos de vertices e de arestas sao gerados juntos. 
+# A busca e' interrompida ao exceder "max_paths" caminhos ou "max_prefixes" 
+# arestas examinadas na expansao dos prefixos, e retorna (caminhos de arestas, 
+# motivo do truncamento: LIMITE_CAMINHOS, LIMITE_PREFIXOS ou None).
+def enum_paths_contratacao_impedida(i: int, 
+                                    max_paths: int = None, 
+                                    max_prefixes: int = None) -> tuple:
+    epaths = []
+    
+    # Descarta os caminhos com a mesma sequencia de vertices, gerados por 
+    # arestas paralelas (ex.: o mesmo relacionamento informado nos dois 
+    # sentidos no CSV), que resultariam em linhas identicas no TXT.
+    vpaths_visitados = set()
+    
+    vpath = [i]
+    epath = []
+    vpath_tipo = [tipo_caminho(pool_graph.vs[i])]
+    stack = [iter(pool_graph.incident(i))]
+    count_prefixes = 0
+    
+    while stack:
+        e = next(stack[-1], None)
+        if (e is None):
+            stack.pop()
+            if epath:
+                vpath.pop()
+                epath.pop()
+                vpath_tipo.pop()
+            continue
+        
+        if ((max_prefixes is not None) and (count_prefixes >= max_prefixes)):
+            return epaths, LIMITE_PREFIXOS
+        count_prefixes += 1
+        
+        source, target = pool_graph.es[e].tuple
+        w = target if (source == vpath[-1]) else source
+        if (w in vpath):
+            continue
+        
+        vpath_tipo.append(tipo_caminho(pool_graph.vs[w]))
+        is_impedido = is_vpath_tipo_impedido(vpath_tipo)
+        is_expansivel = is_vpath_tipo_expansivel(vpath_tipo)
+        if (not (is_impedido or is_expansivel)):
+            vpath_tipo.pop()
+            continue
+        
+        vpath.append(w)
+        epath.append(e)
+        
+        if (is_impedido and 
+            (tuple(vpath) not in vpaths_visitados) and
+            ((vpath_tipo[-1] != util.V_SANCAO) or 
+             is_contratacao_impedida(pool_graph.vs[vpath[0]], pool_graph.vs[vpath[-1]]))):
+            if ((max_paths is not None) and (len(epaths) >= max_paths)):
+                return epaths, LIMITE_CAMINHOS
+            vpaths_visitados.add(tuple(vpath))
+            epaths.append(list(epath))
+        
+        if is_expansivel:
+            stack.append(iter(pool_graph.incident(w)))
+        else:
+            vpath.pop()
+            epath.pop()
+            vpath_tipo.pop()
+    
+    return epaths, None
+
+def verify_all_paths(i: int):
+    iter_counter = pool_iter_counter.increment()
+    
+    epaths, limite = enum_paths_contratacao_impedida(i, pool_max_paths, pool_max_prefixes)
+    for epath_imped in epaths:
+        path_counter = pool_path_counter.increment()
+        log(f"{os.getpid()}: {iter_counter}/{pool_total_licit_contrato} " \
+            f"({round(iter_counter/pool_total_licit_contrato*100, 2)}%) | "\
+            f" {path_counter}. {epath_imped}")
+        log(epath_log_msg(epath_imped), log_file = pool_txt_output_paths)
+        
+    if (limite == LIMITE_CAMINHOS):
+        log(f"{os.getpid()}: Limite de {pool_max_paths} caminhos atingido para o vertice " \
+            f"{pool_graph.vs[i]['name']} (caminhos excedentes descartados)")
+    elif (limite == LIMITE_PREFIXOS):
+        log(f"{os.getpid()}: Limite de {pool_max_prefixes} prefixos atingido para o vertice " \
+            f"{pool_graph.vs[i]['name']} (pesquisa interrompida)")
+
 class GraphAnalysis:
     def __init__(self,
                  csv_edges: str,
-                 output_paths_txt: str):
+                 output_paths_txt: str,
+                 all_paths: bool = False,
+                 max_paths: int = DEFAULT_MAX_PATHS,
+                 max_prefixes: int = DEFAULT_MAX_PREFIXES):
         """Construtor da classe GraphAnalysis.
 
         :param csv_edges str: Caminho do arquivo CSV das arestas do grafo.
         :param output_paths_txt str: Caminho do arquivo TXT para output dos caminhos do grafo que denotam impedimentos.
+        :param all_paths bool: Se True, pesquisa todos os caminhos de impedimento (e nao apenas o caminho minimo) entre cada par de vertices.
+        :param max_paths int: Quantidade maxima de caminhos por licitacao/contrato (utilizado apenas se all_paths = True; None = sem limite).
+        :param max_prefixes int: Quantidade maxima de arestas examinadas na expansao dos prefixos de caminho por licitacao/contrato (utilizado apenas se all_paths = True; None = sem limite).
         """
         self.csv_edges = csv_edges
         self.output_paths_txt = output_paths_txt
+        self.all_paths = all_paths
+        self.max_paths = max_paths
+        self.max_prefixes = max_prefixes
                 
         self._graph = None
         
@@ -180,7 +311,10 @@ class GraphAnalysis:
                                                           total_licit_contrato,
                                                           iter_counter,
                                                           path_counter,
-                                                          self.output_paths_txt)) as pool:
-            pool.map(verify_path, gindex_licit_contrato)
+                                                          self.output_paths_txt,
+                                                          self.max_paths,
+                                                          self.max_prefixes)) as pool:
+            pool.map(verify_all_paths if self.all_paths else verify_path, 
+                     gindex_licit_contrato)
                 
         log(f"TOTAL = {path_counter.value()} caminhos", log_file = self.output_paths_txt)
\ No newline at end of file